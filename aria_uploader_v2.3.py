@@ -20,23 +20,293 @@ Features:
 """
 
 import argparse
+import atexit
+import base64
+import functools
+import io
+import itertools
 import json
 import logging
+import logging.handlers
+import mimetypes
+import multiprocessing
 import os
+import queue
+import re
 import shutil
 import site
+import stat
 import subprocess
 import sys
 import threading
 import time
-import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import webbrowser
 
+import google_crc32c
+import requests
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.retry import DEFAULT_RETRY
+
+# Files from this size on go to the large-file upload queue
+_SMALL_FILE_LIMIT = 8 * 1024 * 1024
+_RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+# Files larger than this are uploaded as concurrent XML multipart chunks
+_LARGE_FILE_THRESHOLD = 100 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+_CHUNK_UPLOAD_WORKERS = 8
+# Default parallel object uploads for a directory (network-bound, so threads suffice)
+_DEFAULT_UPLOAD_WORKERS = 16
+# Files waiting for an upload worker while the directory walk runs ahead
+_UPLOAD_QUEUE_SIZE = 1024
+# Object writes started per second (0 = unlimited); GCS throttles bursts past
+# ~1000 writes/s per prefix with 429s, whose backoff costs more than pacing
+_DEFAULT_UPLOAD_QPS = 500
+# Large files saturate bandwidth on their own, so only a few run at once
+_LARGE_UPLOAD_WORKERS = 2
+# MPS folders (or VRS files) the GUI uploads at once; each folder upload is
+# itself spread over the uploader's worker threads
+_PIPELINE_UPLOAD_WORKERS = 2
+# Status text lines kept before the oldest are dropped
+_STATUS_MAX_LINES = 5000
+# The GUI's single periodic pump: runs posted Tk calls and writes queued status
+# lines every tick, redraws the progress bar and dumps per-file statuses less often
+_PUMP_INTERVAL_MS = 100
+# Tick used while no batch is running and nothing is queued. The pump keeps
+# ticking when idle because worker threads post work via queues without
+# touching Tk, so there is no thread-safe way for them to restart it.
+_PUMP_IDLE_INTERVAL_MS = 500
+_PROGRESS_DRAW_INTERVAL = 1.0
+_STATUS_DUMP_INTERVAL = 5.0
+# Upload tasks handed to each worker process at a time, to amortize IPC
+_PROCESS_TASK_CHUNKSIZE = 8
+# Read size for checksumming local files and streaming uploads
+_FILE_READ_SIZE = 1024 * 1024
+# Uploads rewrite the same content on retry, so transient failures (429/5xx,
+# connection resets) are always retried by the storage client, with backoff
+_UPLOAD_RETRY = DEFAULT_RETRY.with_delay(initial=0.25, maximum=16.0, multiplier=2.0)
+
+# Fallback locations for the Aria CLI: user-site Scripts, then the interpreter's dir
+_SCRIPTS_DIRS = (
+    Path(site.getuserbase()) / f"Python{sys.version_info.major}{sys.version_info.minor}" / "Scripts",
+    Path(sys.executable).parent,
+)
+
+# aria_mps output lines are logged through this logger, whose records are
+# buffered and handed to the root handlers in batches (see _configure_child_logger)
+_child_logger = logging.getLogger("aria.child")
+# Buffered aria_mps lines per flush, and the longest they may sit in the buffer
+_CHILD_LOG_CAPACITY = 200
+_CHILD_LOG_FLUSH_INTERVAL = 1.0
+# Background writer for all log records, started by _configure_logging
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Aria CLI options whose values must never be logged
+_SECRET_FLAGS = frozenset({"--password"})
+
+# aria_mps prints one of these once login has completed
+_AUTH_MARKER_RE = re.compile(r'(authenticated|logged in|login success|token)', re.IGNORECASE)
+# Only the first lines of output can carry the auth marker
+_AUTH_SCAN_LINES = 40
+# Upper bound on how long the auth lock is held if no marker is seen
+_AUTH_TIMEOUT = 10.0
+# Pipe buffer for aria_mps stdout (read in binary mode)
+_CHILD_OUTPUT_BUFSIZE = 1 << 20
+# Minimum seconds between percentage callbacks while parsing aria_mps output
+_PROGRESS_EMIT_INTERVAL = 0.2
+# Minimum seconds between per-file progress updates accepted by the GUI
+_GUI_PROGRESS_INTERVAL = 0.05
+
+# aria_mps log line parsing
+_PCT_RE = re.compile(r"(\d{1,3}(?:\.\d+)?|\.\d+)\s*%")
+# "2026-02-12 15:57:22,438 [PID] [LEVEL] [module:line] - " log prefix
+_LOG_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d+\s+\[\d+\]\s+\[\w+\]\s+\[[^\]]+\]\s+-\s+')
+_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d+\s+')
+_VRS_PREFIX_RE = re.compile(r'\[vrs:[^\]]+\]\s*')
+_CHUNK_RE = re.compile(r'Uploading\s+with\s+chunk_size\s+[\d.]+\s+MB\s+\|\s+')
+# One alternation for all stages; the group that matched indexes _STAGE_NAMES.
+# Groups are in priority order (see _parse_stage)
+_STAGE_RE = re.compile(
+    r'(?-i:\b(Hashing)\b)'
+    r'|(\bIndex\b|Health[\s_-]?check)'
+    r'|\b(Download(?:ed|ing))\b'
+    r'|\b(Encrypt(?:ing|ion))\b'
+    r'|\b(Uploading)\b',
+    re.IGNORECASE,
+)
+_STAGE_NAMES = ('Hashing', 'Index', 'Downloaded', 'Encrypting', 'Uploading')
+
+
+def _parse_stage(line: str) -> Optional[str]:
+    """
+    Stage named in an aria_mps output line, or None.
+    
+    The echoed "[vrs:<path>]" prefix is ignored so folder names can't decide
+    the stage, and the highest-priority stage in the rest of the line wins,
+    not the leftmost one.
+    """
+    if '[vrs:' in line:
+        line = _VRS_PREFIX_RE.sub('', line)
+    group = min((m.lastindex for m in _STAGE_RE.finditer(line)), default=None)
+    return _STAGE_NAMES[group - 1] if group else None
+
+
+def _configure_logging(log_file: str):
+    """
+    Log to log_file and stderr from a background thread.
+    
+    The root logger only gets a QueueHandler, so logging from worker threads
+    is a queue put; a QueueListener does the file and console writes.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Records are fully formatted by the listener's handlers, not here
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    # Stopping drains whatever is still queued
+    atexit.register(_log_listener.stop)
+    _configure_child_logger()
+
+
+def _configure_child_logger():
+    """Route aria_mps output lines to the root handlers through memory buffers."""
+    if _child_logger.handlers:
+        return
+    for handler in logging.getLogger().handlers:
+        _child_logger.addHandler(logging.handlers.MemoryHandler(
+            capacity=_CHILD_LOG_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=handler,
+        ))
+    # Only stop propagation once the buffers exist, otherwise lines would be lost
+    _child_logger.propagate = not _child_logger.handlers
+
+
+def _flush_child_log():
+    """Write out any buffered aria_mps output lines."""
+    for handler in _child_logger.handlers:
+        handler.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _content_type(extension: str) -> str:
+    """MIME type for a file extension, looked up once per extension."""
+    return mimetypes.guess_type("file" + extension)[0] or "application/octet-stream"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(credentials_path: str, mtime_ns: int, pool_size: int) -> storage.Client:
+    """
+    Build a storage client for a service account file, cached across uploaders.
+    
+    Keyed on the file's mtime so edited credentials get a fresh client. Reusing
+    the client keeps its OAuth token and warm connections between runs.
+    """
+    client = storage.Client.from_service_account_json(credentials_path)
+    # Share one pooled HTTP session across all uploads made with this client,
+    # with enough keep-alive connections for every upload thread so none
+    # of them pays a fresh TLS handshake per file
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size * 2,
+    )
+    client._http.mount("https://", adapter)
+    return client
+
+
+def _blob_name(folder_prefix: str, name: str) -> str:
+    """Place name under an optional bucket folder prefix."""
+    folder = folder_prefix.strip("/")
+    return f"{folder}/{name}" if folder else name
+
+
+def _file_crc32c(file_path: str) -> str:
+    """Base64 CRC32C of a file, in the format GCS reports for blob.crc32c."""
+    checksum = google_crc32c.Checksum()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_FILE_READ_SIZE), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("ascii")
+
+
+# Bucket handle and rate limiter of an upload worker process, set by _init_upload_process
+_process_bucket = None
+_process_rate_limiter = None
+
+
+def _init_upload_process(credentials_path: str, bucket_name: str, max_qps: float):
+    """Pool initializer: give each worker process its own client, bucket and share of the QPS."""
+    global _process_bucket, _process_rate_limiter
+    _process_bucket = _get_client(credentials_path, os.stat(credentials_path).st_mtime_ns, 1).bucket(bucket_name)
+    _process_rate_limiter = RateLimiter(max_qps) if max_qps > 0 else None
+
+
+def _upload_in_process(task: Tuple[str, str, str]) -> Tuple[str, Optional[str]]:
+    """Upload one small file from a worker process; returns (rel_path, error)."""
+    rel_path, file_path, dest_name = task
+    try:
+        if _process_rate_limiter is not None:
+            _process_rate_limiter.acquire()
+        _process_bucket.blob(dest_name).upload_from_filename(
+            file_path,
+            content_type=_content_type(os.path.splitext(file_path)[1].lower()),
+            checksum="crc32c",
+            retry=_UPLOAD_RETRY,
+        )
+        return rel_path, None
+    except Exception as e:
+        # Exceptions from the client don't always pickle; send the message back
+        return rel_path, str(e)
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every regular file under root (depth-first, no symlinks).
+    
+    Subdirectories that can't be read (or vanish mid-walk) are skipped with a
+    warning, as os.walk did; an error opening root itself is raised.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError as e:
+            if path is root:
+                raise
+            logging.warning(f"Skipping unreadable directory {path}: {str(e)}")
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _has_files(root: str) -> bool:
+    """True if root contains at least one regular file; stops at the first one."""
+    files = _iter_files(root)
+    try:
+        return next(files, None) is not None
+    finally:
+        # Close the generator so its open scandir handles are released now
+        files.close()
 
 
 class CredentialsManager:
@@ -45,12 +315,37 @@ class CredentialsManager:
     CONFIG_DIR = Path.home() / '.aria_uploader'
     CONFIG_FILE = CONFIG_DIR / 'credentials.json'
     GCLOUD_CONFIG_FILE = CONFIG_DIR / 'gcloud_settings.json'
+    # Parsed config files, reused while the file's mtime is unchanged: {path: (mtime_ns, data)}
+    _config_cache: dict = {}
     
     @classmethod
     def ensure_config_dir(cls):
         """Create config directory if it doesn't exist."""
         cls.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     
+    @classmethod
+    def _read_config(cls, config_file: Path) -> Optional[dict]:
+        """
+        Read a JSON config file, returning the cached data if it hasn't changed.
+        
+        Returns:
+            Parsed settings dict, or None if the file does not exist
+        """
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            cls._config_cache.pop(config_file, None)
+            return None
+        
+        cached = cls._config_cache.get(config_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        # json.loads decodes the raw bytes directly (no text-mode wrapper)
+        data = json.loads(config_file.read_bytes())
+        cls._config_cache[config_file] = (mtime, data)
+        return data
+    
     @classmethod
     def save_credentials(cls, username: str, password: str):
         """
@@ -70,6 +365,7 @@ class CredentialsManager:
             
             with open(cls.CONFIG_FILE, 'w') as f:
                 json.dump(credentials, f, indent=2)
+            cls._config_cache.pop(cls.CONFIG_FILE, None)
             
             logging.info(f"Credentials saved to {cls.CONFIG_FILE}")
             return True
@@ -86,13 +382,11 @@ class CredentialsManager:
             Tuple of (username, password) or (None, None) if not found
         """
         try:
-            if not cls.CONFIG_FILE.exists():
+            credentials = cls._read_config(cls.CONFIG_FILE)
+            if credentials is None:
                 logging.info("No saved credentials found")
                 return None, None
             
-            with open(cls.CONFIG_FILE, 'r') as f:
-                credentials = json.load(f)
-            
             username = credentials.get('username')
             password = credentials.get('password')
             
@@ -109,6 +403,7 @@ class CredentialsManager:
     def clear_credentials(cls):
         """Clear saved credentials."""
         try:
+            cls._config_cache.pop(cls.CONFIG_FILE, None)
             if cls.CONFIG_FILE.exists():
                 cls.CONFIG_FILE.unlink()
                 logging.info("Credentials cleared")
@@ -136,6 +431,7 @@ class CredentialsManager:
             
             with open(cls.GCLOUD_CONFIG_FILE, 'w') as f:
                 json.dump(settings, f, indent=2)
+            cls._config_cache.pop(cls.GCLOUD_CONFIG_FILE, None)
             
             logging.info(f"Google Cloud settings saved to {cls.GCLOUD_CONFIG_FILE}")
             return True
@@ -152,13 +448,11 @@ class CredentialsManager:
             Tuple of (gcloud_cred_path, bucket_name) or (None, None) if not found
         """
         try:
-            if not cls.GCLOUD_CONFIG_FILE.exists():
+            settings = cls._read_config(cls.GCLOUD_CONFIG_FILE)
+            if settings is None:
                 logging.info("No saved Google Cloud settings found")
                 return None, None
             
-            with open(cls.GCLOUD_CONFIG_FILE, 'r') as f:
-                settings = json.load(f)
-            
             gcloud_cred_path = settings.get('gcloud_cred_path')
             bucket_name = settings.get('bucket_name')
             
@@ -175,6 +469,7 @@ class CredentialsManager:
     def clear_gcloud_settings(cls):
         """Clear saved Google Cloud settings."""
         try:
+            cls._config_cache.pop(cls.GCLOUD_CONFIG_FILE, None)
             if cls.GCLOUD_CONFIG_FILE.exists():
                 cls.GCLOUD_CONFIG_FILE.unlink()
                 logging.info("Google Cloud settings cleared")
@@ -193,6 +488,9 @@ class VRStoMPSConverter:
     not a single "MPS file".
     """
     
+    # Resolved Aria CLI path, shared by all converters once found
+    _aria_executable: Optional[str] = None
+    
     def __init__(self, aria_username: str, aria_password: str):
         """
         Initialize the converter with Aria credentials.
@@ -208,14 +506,7 @@ class VRStoMPSConverter:
     @staticmethod
     def setup_logging():
         """Configure logging for the test program."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('vrs_to_mps_test.log'),
-                logging.StreamHandler()
-            ]
-        )
+        _configure_logging('vrs_to_mps_test.log')
     
  
     @staticmethod
@@ -230,29 +521,37 @@ class VRStoMPSConverter:
             True if file exists and is readable, False otherwise
         """
         try:
-            path = Path(vrs_path)
-            if not path.exists():
+            # One stat call answers exists / is-file / size
+            try:
+                st = os.stat(vrs_path)
+            except FileNotFoundError:
                 logging.error(f"VRS file not found: {vrs_path}")
                 return False
             
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 logging.error(f"Path is not a file: {vrs_path}")
                 return False
             
-            if not path.suffix.lower() == '.vrs':
+            if not vrs_path.lower().endswith('.vrs'):
                 logging.warning(f"File does not have .vrs extension: {vrs_path}")
             
-            file_size = path.stat().st_size
-            logging.info(f"VRS file validated: {vrs_path} ({file_size} bytes)")
+            logging.info(f"VRS file validated: {vrs_path} ({st.st_size} bytes)")
             return True
         
         except Exception as e:
             logging.error(f"Error validating VRS file: {str(e)}")
             return False
 
+    @classmethod
+    def _resolve_aria_executable(cls) -> Optional[str]:
+        """Locate Aria CLI executable on Windows (cached once found)."""
+        if cls._aria_executable is None:
+            cls._aria_executable = cls._find_aria_executable()
+        return cls._aria_executable
+
     @staticmethod
-    def _resolve_aria_executable() -> Optional[str]:
-        """Locate Aria CLI executable on Windows."""
+    def _find_aria_executable() -> Optional[str]:
+        """Search ARIA_CLI_PATH, PATH and the Python Scripts dirs for the Aria CLI."""
         env_path = os.getenv("ARIA_CLI_PATH")
         if env_path and Path(env_path).exists():
             return env_path
@@ -271,28 +570,18 @@ class VRStoMPSConverter:
             if resolved:
                 return resolved
 
-        user_base = site.getuserbase()
-        version_tag = f"Python{sys.version_info.major}{sys.version_info.minor}"
-        scripts_dir = Path(user_base) / version_tag / "Scripts"
-        for name in candidates:
-            candidate_path = scripts_dir / name
-            if candidate_path.exists():
-                return str(candidate_path)
-
-        current_scripts_dir = Path(sys.executable).parent
-        for name in candidates:
-            candidate_path = current_scripts_dir / name
-            if candidate_path.exists():
-                return str(candidate_path)
+        for scripts_dir in _SCRIPTS_DIRS:
+            for name in candidates:
+                candidate_path = scripts_dir / name
+                if candidate_path.exists():
+                    return str(candidate_path)
 
         return None
 
     @staticmethod
     def _expected_mps_output_dir(vrs_file: str) -> Path:
         vrs_path = Path(vrs_file)
-        base_name = vrs_path.name
-        if vrs_path.suffix.lower() == ".vrs":
-            base_name = vrs_path.name[:-4]
+        base_name = vrs_path.stem if vrs_path.suffix.lower() == ".vrs" else vrs_path.name
         return vrs_path.parent / f"mps_{base_name}_vrs"
     
     def convert_vrs_to_mps(self, vrs_file: str, output_dir: str, progress_callback=None, auth_lock=None) -> Tuple[bool, Optional[str]]:
@@ -314,6 +603,7 @@ class VRStoMPSConverter:
             if progress_callback:
                 progress_callback(message, percentage)
 
+        vrs_name = Path(vrs_file).name
         try:
             # Validate VRS file
             if not self.validate_vrs_file(vrs_file):
@@ -362,58 +652,83 @@ class VRStoMPSConverter:
                 source_output_dir = Path(output_dir)
 
             # Log command without password
-            safe_command = aria_command.copy()
-            if "--password" in safe_command:
-                pwd_index = safe_command.index("--password") + 1
-                if pwd_index < len(safe_command):
-                    safe_command[pwd_index] = "***"
-            logging.info(f"Executing Aria CLI command (VRS: {Path(vrs_file).name}): {' '.join(safe_command)}")
+            safe_command = ' '.join(
+                "***" if i > 0 and aria_command[i - 1] in _SECRET_FLAGS else arg
+                for i, arg in enumerate(aria_command)
+            )
+            logging.info(f"Executing Aria CLI command (VRS: {vrs_name}): {safe_command}")
             logging.info(f"Expected output directory: {source_output_dir if use_mps_cli else output_dir}")
 
+            # Child output is pumped on a background thread so the auth lock can be
+            # released as soon as aria_mps reports that login has completed
+            output_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+            auth_done = threading.Event()
+
+            def _pump_output(stream):
+                # Universal newlines end a line at \r as well as \n, so progress
+                # that aria_mps redraws in place arrives as it is printed
+                line_no = 0
+                try:
+                    for raw in io.TextIOWrapper(stream, encoding="utf-8", errors="replace", newline=None):
+                        line = raw.rstrip("\n")
+                        if not auth_done.is_set():
+                            if _AUTH_MARKER_RE.search(line) or line_no >= _AUTH_SCAN_LINES:
+                                auth_done.set()
+                        line_no += 1
+                        output_queue.put(line)
+                finally:
+                    auth_done.set()
+                    output_queue.put(None)
+
+            def _start_process() -> subprocess.Popen:
+                child = subprocess.Popen(
+                    aria_command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=_CHILD_OUTPUT_BUFSIZE,
+                )
+                threading.Thread(target=_pump_output, args=(child.stdout,), daemon=True).start()
+                return child
+
             # Use auth lock to prevent concurrent authentication (fixes race condition)
-            # aria_mps authenticates early in the process, so we lock during startup
+            # aria_mps authenticates early in the process, so we lock until it reports login
             if auth_lock is not None:
-                logging.info(f"Acquiring authentication lock for {Path(vrs_file).name}...")
+                logging.info(f"Acquiring authentication lock for {vrs_name}...")
                 auth_lock.acquire()
                 try:
-                    # Execute the Aria CLI command
-                    process = subprocess.Popen(
-                        aria_command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                    )
-                    # Wait a bit for authentication to complete before releasing lock
-                    # This ensures auth finishes before next process starts authenticating
-                    time.sleep(3)
-                    logging.info(f"Authentication lock released for {Path(vrs_file).name}")
+                    process = _start_process()
+                    if not auth_done.wait(timeout=_AUTH_TIMEOUT):
+                        logging.warning(f"No login confirmation from Aria CLI after {_AUTH_TIMEOUT:.0f}s for {vrs_name}")
+                    logging.info(f"Authentication lock released for {vrs_name}")
                 finally:
                     auth_lock.release()
             else:
                 # No lock provided, run normally
-                process = subprocess.Popen(
-                    aria_command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                )
+                process = _start_process()
 
             # Read output from aria_mps and update progress
             output_lines = []
             last_percentage = -1.0
-            last_debug_message_time = time.time()
+            last_debug_message_time = time.monotonic()
             last_percentage_line = ""
+            # Percentage updates are coalesced: only the latest value is kept and
+            # it is emitted at most every _PROGRESS_EMIT_INTERVAL or on stage change
+            pending_pct: Optional[float] = None
+            emitted_stage: Optional[str] = None
+            emitted_pct: Optional[float] = None
+            last_emit_time = 0.0
+            # Source line of the last 5-second status message (skip repeats)
+            displayed_line = ""
 
             def _parse_percentage(line: str) -> Optional[float]:
-                import re
                 # Match percentage patterns, including those with leading decimal like .67%
                 # Also match from right to left to get the last percentage in the line
-                matches = list(re.finditer(r"(\d{1,3}(?:\.\d+)?|\.\d+)\s*%", line))
+                matches = _PCT_RE.findall(line)
                 if not matches:
                     return None
                 try:
                     # Use the last match in case there are multiple percentages
-                    val = float(matches[-1].group(1))
+                    val = float(matches[-1])
                     # If value starts with just a decimal (like .67), it's already fractional
                     # If value is between 0-1, it's already the correct decimal representation
                     # If value is >1, it's a normal percentage
@@ -423,99 +738,107 @@ class VRStoMPSConverter:
 
             def _truncate_percentage_in_line(line: str) -> str:
                 """Truncate percentage values in a line to 2 decimal places."""
-                import re
                 def _truncate_match(m):
                     try:
-                        val = float(m.group(1))
-                        trunc = math.trunc(val * 100) / 100.0
-                        return f"{trunc:.2f}%"
+                        return f"{int(float(m.group(1)) * 100) / 100:.2f}%"
                     except Exception:
                         return m.group(0)
-                return re.sub(r"(\d{1,3}(?:\.\d+)?|\.\d+)\s*%", _truncate_match, line)
+                return _PCT_RE.sub(_truncate_match, line)
             
-            def _extract_stage(line: str) -> Optional[str]:
-                """Extract the processing stage from aria_mps output."""
-                # Match specific patterns from aria_mps output
-                import re
-
-                # Hashing stage
-                if re.search(r'\bHashing\b', line):
-                    return 'Hashing'
-
-                # Indexing/health check stage
-                if re.search(r'\bIndex\b', line, re.IGNORECASE) or re.search(r'Health[\s_-]?check', line, re.IGNORECASE):
-                    return 'Index'
-
-                # Downloaded stage (MPS being downloaded)
-                if re.search(r'\bDownloaded\b', line, re.IGNORECASE) or re.search(r'\bDownloading\b', line, re.IGNORECASE):
-                    return 'Downloaded'
-
-                # Encrypting stage
-                if re.search(r'\bEncrypting\b', line, re.IGNORECASE) or re.search(r'\bEncryption\b', line, re.IGNORECASE):
-                    return 'Encrypting'
-
-                # Uploading stage
-                if re.search(r'\bUploading\b', line, re.IGNORECASE):
-                    return 'Uploading'
-
-                return None
+            def _parse_line(line: str) -> Tuple[Optional[str], Optional[float]]:
+                """Extract (stage, percentage) from one aria_mps output line in a single pass."""
+                stage = _parse_stage(line)
+                pct = _parse_percentage(line) if "%" in line else None
+                return stage, pct
             
             def _clean_message(line: str) -> str:
                 """Clean up aria_mps log line to show only relevant message."""
-                import re
-                
                 # Remove timestamp prefix: "2026-02-12 15:57:22,438 [PID] [LEVEL] [module:line] - "
-                # Pattern: date time,ms [number] [LEVEL] [file:line] - actual message
-                cleaned = re.sub(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d+\s+\[\d+\]\s+\[\w+\]\s+\[[^\]]+\]\s+-\s+', '', line)
+                cleaned = _LOG_PREFIX_RE.sub('', line)
                 
                 # If pattern didn't match, try simpler patterns
                 if cleaned == line:
                     # Try removing just leading timestamp
-                    cleaned = re.sub(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d+\s+', '', line)
+                    cleaned = _TIMESTAMP_RE.sub('', line)
                 
                 # Remove [vrs:path] prefix if present, keep it cleaner
-                cleaned = re.sub(r'\[vrs:[^\]]+\]\s*', '', cleaned)
+                cleaned = _VRS_PREFIX_RE.sub('', cleaned)
                 
                 # Clean up "Uploading with chunk_size X.XX MB |" to just show the important part
-                cleaned = re.sub(r'Uploading\s+with\s+chunk_size\s+[\d.]+\s+MB\s+\|\s+', 'Uploading: ', cleaned)
+                cleaned = _CHUNK_RE.sub('Uploading: ', cleaned)
                 
                 return cleaned.strip()
             
             current_stage = None
 
+            def _emit_pending():
+                """Send the coalesced percentage unless it was the last one sent."""
+                nonlocal pending_pct, emitted_stage, emitted_pct
+                if pending_pct is not None and (current_stage, pending_pct) != (emitted_stage, emitted_pct):
+                    update_progress(current_stage or "", pending_pct)
+                    emitted_stage = current_stage
+                    emitted_pct = pending_pct
+                pending_pct = None
+
+            child_log_enabled = _child_logger.isEnabledFor(logging.INFO)
+            last_log_flush = time.monotonic()
+
             if process.stdout:
-                for line in process.stdout:
-                    sline = line.rstrip("\n")
+                while True:
+                    # Wake up soon enough to deliver a held-back percentage if
+                    # the tool goes quiet right after printing it
+                    timeout = _CHILD_LOG_FLUSH_INTERVAL if pending_pct is None else _PROGRESS_EMIT_INTERVAL
+                    try:
+                        sline = output_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        # Quiet phase: send the latest percentage and write out
+                        # buffered lines instead of holding them until the next line
+                        _emit_pending()
+                        last_emit_time = time.monotonic()
+                        _flush_child_log()
+                        last_log_flush = last_emit_time
+                        continue
+                    if sline is None:
+                        # The last percentage printed may still be held back
+                        _emit_pending()
+                        break
                     output_lines.append(sline)
-                    logging.info(f"  {sline}")
+                    if child_log_enabled:
+                        _child_logger.info("  %s", sline)
 
                     # Extract stage and percentage from this line
-                    stage = _extract_stage(sline)
+                    stage, pct = _parse_line(sline)
                     if stage:
                         current_stage = stage
                     
-                    pct = _parse_percentage(sline)
                     if pct is not None:
                         last_percentage = pct
                         last_percentage_line = sline
-                        # Update percentage immediately (no message to debug box, just the percentage)
-                        # This allows progress bar to update every 1 second
-                        pct_trunc = math.trunc(pct * 100) / 100.0
-                        # Also pass the stage info to the callback
-                        if current_stage:
-                            update_progress(current_stage, pct_trunc)
-                        else:
-                            update_progress("", pct_trunc)
+                        pending_pct = int(pct * 100) / 100
+
+                    # Emit the latest percentage (no message to debug box, just the
+                    # percentage and stage) when the throttle window has passed
+                    now = time.monotonic()
+                    if (now - last_log_flush) >= _CHILD_LOG_FLUSH_INTERVAL:
+                        _flush_child_log()
+                        last_log_flush = now
+                    if pending_pct is not None and (
+                        current_stage != emitted_stage
+                        or (now - last_emit_time) >= _PROGRESS_EMIT_INTERVAL
+                    ):
+                        _emit_pending()
+                        last_emit_time = now
 
                     # Check if this is an error/exception line (show immediately)
-                    if "error" in sline.lower() or "exception" in sline.lower():
+                    lowered = sline.lower()
+                    if "error" in lowered or "exception" in lowered:
                         update_progress(sline, -1.0)
                         continue
 
-                    # Send debug message every 5 seconds (only the latest percentage status)
-                    now = time.time()
+                    # Send debug message every 5 seconds (only the latest percentage status).
+                    # The line is only cleaned/formatted here, and skipped if unchanged.
                     if (now - last_debug_message_time) >= 5.0:
-                        if last_percentage >= 0 and last_percentage_line:
+                        if last_percentage >= 0 and last_percentage_line and last_percentage_line != displayed_line:
                             # Clean and format the message for display
                             cleaned_line = _clean_message(last_percentage_line)
                             truncated_line = _truncate_percentage_in_line(cleaned_line)
@@ -527,9 +850,11 @@ class VRStoMPSConverter:
                                 display_message = truncated_line
                             
                             update_progress(display_message, -1.0)  # -1 means don't update percentage (already updated above)
+                            displayed_line = last_percentage_line
                         last_debug_message_time = now
 
             process.wait()
+            _flush_child_log()
 
             if process.returncode == 0:
                 if use_mps_cli:
@@ -547,13 +872,22 @@ class VRStoMPSConverter:
                         try:
                             logging.info(f"Moving conversion output from {source_output_dir} to {output_dir}...")
                             
-                            # If destination exists, remove it first
+                            # If destination exists, remove it first. It is usually the
+                            # empty folder created above, which a single rmdir handles.
                             if os.path.exists(output_dir):
-                                logging.info(f"Removing existing directory: {output_dir}")
-                                shutil.rmtree(output_dir)
+                                try:
+                                    os.rmdir(output_dir)
+                                except OSError:
+                                    logging.info(f"Removing existing directory: {output_dir}")
+                                    shutil.rmtree(output_dir)
                             
-                            # Move the directory
-                            shutil.move(str(source_output_dir), output_dir)
+                            # Move the directory: a single rename on the same drive,
+                            # copy + delete across drives
+                            same_device = os.stat(source_output_dir).st_dev == os.stat(Path(output_dir).parent).st_dev
+                            if same_device:
+                                os.replace(source_output_dir, output_dir)
+                            else:
+                                shutil.move(str(source_output_dir), output_dir)
                             logging.info(f"Successfully moved conversion output to {output_dir}")
                             final_output_dir = output_dir
                         except Exception as e:
@@ -568,37 +902,28 @@ class VRStoMPSConverter:
                     # For non-aria_mps CLI, output is directly in output_dir
                     final_output_dir = output_dir
 
-                # List generated MPS files
+                # List generated MPS files (one directory scan for all summaries)
+                logging.info("VRS to MPS conversion successful!")
                 try:
-                    mps_files = os.listdir(final_output_dir)
-                    logging.info("VRS to MPS conversion successful!")
-                    logging.info(f"Generated {len(mps_files)} file(s):")
-                    for mps_file in mps_files:
-                        file_path = os.path.join(final_output_dir, mps_file)
-                        if os.path.isfile(file_path):
-                            file_size = os.path.getsize(file_path)
-                            logging.info(f"  - {mps_file} ({file_size} bytes)")
+                    with os.scandir(final_output_dir) as it:
+                        dir_contents = list(it)
+                    file_count = sum(entry.is_file(follow_symlinks=False) for entry in dir_contents)
+                    logging.info(f"Generated {file_count} file(s)")
+                    logging.info(f"Output directory contains {len(dir_contents)} item(s):")
+                    for entry in dir_contents:
+                        if entry.is_file(follow_symlinks=False):
+                            logging.info(f"  FILE: {entry.name} ({entry.stat().st_size} bytes)")
+                        elif entry.is_dir(follow_symlinks=False):
+                            logging.info(f"  DIR:  {entry.name}/")
+                except FileNotFoundError:
+                    logging.error(f"Output directory does not exist: {final_output_dir}")
                 except Exception as e:
                     logging.warning(f"Could not list output files: {str(e)}")
 
                 if last_percentage >= 0:
                     update_progress("", max(100.0, last_percentage))
                 
-                # Debug: Log the output directory and its contents before returning
                 logging.info(f"Conversion complete. Final output directory: {final_output_dir}")
-                if os.path.exists(final_output_dir):
-                    dir_contents = os.listdir(final_output_dir)
-                    logging.info(f"Output directory contains {len(dir_contents)} item(s):")
-                    for item in dir_contents:
-                        item_path = os.path.join(final_output_dir, item)
-                        if os.path.isfile(item_path):
-                            size = os.path.getsize(item_path)
-                            logging.info(f"  FILE: {item} ({size} bytes)")
-                        elif os.path.isdir(item_path):
-                            logging.info(f"  DIR:  {item}/")
-                else:
-                    logging.error(f"Output directory does not exist: {final_output_dir}")
-                
                 return True, final_output_dir
             else:
                 error_msg = f"Return code: {process.returncode}"
@@ -620,18 +945,53 @@ class VRStoMPSConverter:
             return False, None
 
 
+class RateLimiter:
+    """Token bucket shared by upload threads: allows `rate` acquires per second on average."""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        # Allow up to one second's worth of writes in a burst after idling
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so waiters are paced
+            # without holding the lock while they sleep
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
 class GoogleCloudUploader:
     """Google Cloud Storage uploader for converted MPS files."""
     
-    def __init__(self, credentials_path: str):
+    def __init__(self, credentials_path: str, max_workers: int = _DEFAULT_UPLOAD_WORKERS,
+                 use_processes: bool = False, max_qps: float = _DEFAULT_UPLOAD_QPS):
         """
         Initialize the uploader with Google Cloud credentials.
         
         Args:
             credentials_path: Path to service account JSON file
+            max_workers: Number of files uploaded in parallel by upload_directory
+            use_processes: Upload small files from a pool of worker processes instead of threads
+            max_qps: Object uploads started per second across all workers (0 = unlimited)
         """
         self.credentials_path = credentials_path
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.max_qps = max_qps
+        self._rate_limiter = RateLimiter(max_qps) if max_qps > 0 else None
         self.client = None
+        # Bucket handles by name, populated by verify_bucket
+        self._buckets: dict = {}
     
     def initialize_client(self) -> Tuple[bool, Optional[str]]:
         """
@@ -641,7 +1001,12 @@ class GoogleCloudUploader:
             Tuple of (success: bool, error_message: Optional[str])
         """
         try:
-            self.client = storage.Client.from_service_account_json(self.credentials_path)
+            self.client = _get_client(
+                self.credentials_path,
+                os.stat(self.credentials_path).st_mtime_ns,
+                self.max_workers + _LARGE_UPLOAD_WORKERS,
+            )
+            self._buckets.clear()
             logging.info("Google Cloud Storage client initialized")
             return True, None
         except Exception as e:
@@ -662,7 +1027,7 @@ class GoogleCloudUploader:
         try:
             if self.client is None:
                 return False, "Google Cloud client not initialized"
-            self.client.get_bucket(bucket_name)
+            self._buckets[bucket_name] = self.client.get_bucket(bucket_name)
             logging.info(f"Bucket '{bucket_name}' verified")
             return True, None
         except Exception as e:
@@ -670,6 +1035,13 @@ class GoogleCloudUploader:
             logging.error(error_msg)
             return False, error_msg
     
+    def _get_bucket(self, bucket_name: str):
+        """Return the cached bucket handle, creating one if it wasn't verified."""
+        bucket = self._buckets.get(bucket_name)
+        if bucket is None:
+            bucket = self._buckets[bucket_name] = self.client.bucket(bucket_name)
+        return bucket
+    
     def upload_file(self, bucket_name: str, file_path: str, folder_prefix: str = "", 
                    progress_callback=None) -> Tuple[bool, Optional[str]]:
         """
@@ -687,15 +1059,15 @@ class GoogleCloudUploader:
         try:
             if self.client is None:
                 return False, "Google Cloud client not initialized"
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             file_name = os.path.basename(file_path)
-            dest_name = f"{folder_prefix.rstrip('/')}/{file_name}" if folder_prefix else file_name
+            dest_name = _blob_name(folder_prefix, file_name)
             
-            if progress_callback:
+            if progress_callback is not None:
                 progress_callback(f"Uploading {file_name}...", -1)
             
-            blob = bucket.blob(dest_name)
-            blob.upload_from_filename(file_path)
+            # Large VRS recordings go through a parallel composite (XML multipart) upload
+            self._upload_one(bucket, file_path, dest_name)
             
             logging.info(f"Successfully uploaded {file_name} to {dest_name}")
             return True, None
@@ -704,6 +1076,89 @@ class GoogleCloudUploader:
             logging.error(error_msg)
             return False, error_msg
     
+    @staticmethod
+    def _upload_in_chunks(blob, file_path: str, content_type: Optional[str] = None):
+        """
+        Upload a large file as concurrent XML multipart chunks.
+        
+        Chunks are uploaded from worker processes (each with its own HTTP/SSL
+        stack) and composed server-side into the final object.
+        """
+        transfer_manager.upload_chunks_concurrently(
+            file_path,
+            blob,
+            content_type=content_type,
+            chunk_size=_UPLOAD_CHUNK_SIZE,
+            max_workers=_CHUNK_UPLOAD_WORKERS,
+            worker_type=transfer_manager.PROCESS,
+        )
+    
+    def _upload_in_processes(self, bucket_name: str,
+                             tasks: Iterator[Tuple[str, str, str]]) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Upload (rel_path, file_path, dest_name) tasks from a pool of worker processes.
+        
+        Each process has its own client and HTTP/SSL stack, so TLS work isn't
+        serialized by the GIL. Tasks are consumed as they are produced, so a
+        generator can stream them in; yields (rel_path, error) as uploads finish.
+        """
+        # Don't start any processes if there is nothing to upload
+        first = next(tasks, None)
+        if first is None:
+            return
+        tasks = itertools.chain((first,), tasks)
+        processes = self.max_workers
+        # Each process paces its own uploads, so split the rate between them
+        with multiprocessing.Pool(processes=processes, initializer=_init_upload_process,
+                                  initargs=(self.credentials_path, bucket_name,
+                                            self.max_qps / processes)) as pool:
+            yield from pool.imap_unordered(_upload_in_process, tasks, chunksize=_PROCESS_TASK_CHUNKSIZE)
+    
+    @staticmethod
+    def _list_existing(bucket, prefix: str) -> dict:
+        """
+        Map blob name -> (size, crc32c) for objects already under prefix.
+        
+        Returns an empty dict if the listing fails (e.g. no list permission),
+        in which case everything is uploaded.
+        """
+        try:
+            return {
+                blob.name: (blob.size, blob.crc32c)
+                for blob in bucket.list_blobs(prefix=prefix, fields="items(name,size,crc32c),nextPageToken")
+            }
+        except Exception as e:
+            logging.warning(f"Could not list existing objects under '{prefix}', uploading all files: {str(e)}")
+            return {}
+    
+    @staticmethod
+    def _is_unchanged(existing: dict, dest_name: str, file_path: str, size: int) -> bool:
+        """True if dest_name already holds this file (same size and CRC32C)."""
+        remote = existing.get(dest_name)
+        # Only checksum the local file when the size already matches
+        return remote is not None and remote[0] == size and remote[1] == _file_crc32c(file_path)
+    
+    def _upload_one(self, bucket, file_path: str, dest_name: str, size: Optional[int] = None):
+        """Upload one file to dest_name, using chunked uploads for large files."""
+        blob = bucket.blob(dest_name)
+        if size is None:
+            size = os.path.getsize(file_path)
+        content_type = _content_type(os.path.splitext(file_path)[1].lower())
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        if size > _LARGE_FILE_THRESHOLD:
+            self._upload_in_chunks(blob, file_path, content_type)
+        elif size >= _SMALL_FILE_LIMIT:
+            # Mid-size files: resumable upload streamed in fixed-size chunks, so
+            # each in-flight upload holds one chunk in memory, not the whole file
+            blob.chunk_size = _RESUMABLE_CHUNK_SIZE
+            with open(file_path, "rb", buffering=_FILE_READ_SIZE) as f:
+                blob.upload_from_file(f, size=size, rewind=False, content_type=content_type,
+                                      checksum="crc32c", retry=_UPLOAD_RETRY)
+        else:
+            blob.upload_from_filename(file_path, content_type=content_type, checksum="crc32c",
+                                      retry=_UPLOAD_RETRY)
+    
     def upload_directory(self, bucket_name: str, directory_path: str, folder_prefix: str = "",
                         progress_callback=None) -> Tuple[bool, Optional[str], int]:
         """
@@ -730,55 +1185,135 @@ class GoogleCloudUploader:
                 logging.error(error_msg)
                 return False, error_msg, 0
             
-            # Recursively find all files in the directory tree
-            all_files = []
-            for root, dirs, files in os.walk(directory_path):
-                for file_name in files:
-                    file_path = os.path.join(root, file_name)
-                    all_files.append((file_path, file_name, root))
+            root = os.path.normpath(directory_path)
+            base_len = len(os.path.join(root, ""))
+            bucket = self._get_bucket(bucket_name)
+            dir_base_name = os.path.basename(root)
+            # Built once; each blob name is then blob_name_prefix + relative path
+            blob_name_prefix = _blob_name(folder_prefix, dir_base_name) + "/"
+            log_each_file = logging.getLogger().isEnabledFor(logging.DEBUG)
+            # GCS names use forward slashes; only Windows paths need converting
+            convert_sep = os.sep != "/"
             
-            logging.info(f"Found {len(all_files)} file(s) (including in subdirectories) in {directory_path}")
-            if all_files:
-                for file_path, _, _ in all_files:
-                    rel_path = os.path.relpath(file_path, directory_path)
-                    logging.info(f"  - {rel_path}")
+            found_count = 0
+            done_count = 0
+            uploaded_count = 0
+            skipped_count = 0
+            count_lock = threading.Lock()
+            # Walk -> upload hand-off, split by size: many workers for small files
+            # (latency-bound), a few for large ones (bandwidth-bound). Bounded so
+            # huge trees don't sit in memory.
+            small_queue: "queue.Queue[Optional[Tuple[str, str, int]]]" = queue.Queue(maxsize=_UPLOAD_QUEUE_SIZE)
+            large_queue: "queue.Queue[Optional[Tuple[str, str, int]]]" = queue.Queue(maxsize=_UPLOAD_QUEUE_SIZE)
             
-            if not all_files:
-                return False, "No files found in directory", 0
+            # Objects from a previous run; identical files are skipped and counted as uploaded
+            existing = self._list_existing(bucket, blob_name_prefix)
             
-            bucket = self.client.bucket(bucket_name)
-            uploaded_count = 0
-            dir_base_name = os.path.basename(directory_path)
+            def _record(rel_path: str, error: Optional[str] = None, skipped: bool = False):
+                nonlocal done_count, uploaded_count, skipped_count
+                # Per-file lines only at DEBUG; a summary is logged at the end
+                if error is not None:
+                    logging.warning(f"Failed to upload {rel_path}: {error}")
+                elif log_each_file:
+                    if skipped:
+                        logging.debug(f"  - {rel_path} (unchanged, skipped)")
+                    else:
+                        logging.debug(f"  - {rel_path} -> {blob_name_prefix}{rel_path}")
+                with count_lock:
+                    done_count += 1
+                    uploaded_count += error is None
+                    skipped_count += skipped
+                    if progress_callback is not None:
+                        progress_callback(f"Uploaded {done_count} file(s): {rel_path}", -1)
             
-            for idx, (file_path, file_name, root_dir) in enumerate(all_files, 1):
-                # Get relative path from the base directory to preserve structure
-                rel_path = os.path.relpath(file_path, directory_path)
-                
-                # Build destination path: prefix/foldername/relative/path
-                if folder_prefix:
-                    dest_name = f"{folder_prefix.rstrip('/')}/{dir_base_name}/{rel_path}"
-                else:
-                    dest_name = f"{dir_base_name}/{rel_path}"
-                
-                # Normalize path separators for GCS (use forward slashes)
-                dest_name = dest_name.replace("\\", "/")
-                
-                if progress_callback:
-                    progress_callback(f"Uploading {idx}/{len(all_files)}: {rel_path}", -1)
-                
+            def _upload_worker(file_queue: queue.Queue):
+                while True:
+                    item = file_queue.get()
+                    if item is None:
+                        return
+                    rel_path, file_path, size = item
+                    dest_name = blob_name_prefix + rel_path
+                    try:
+                        if existing and self._is_unchanged(existing, dest_name, file_path, size):
+                            _record(rel_path, skipped=True)
+                            continue
+                        self._upload_one(bucket, file_path, dest_name, size)
+                        _record(rel_path)
+                    except Exception as e:
+                        _record(rel_path, str(e))
+            
+            def _process_tasks(file_queue: queue.Queue) -> Iterator[Tuple[str, str, str]]:
+                """Small files from file_queue that still need uploading, as process-pool tasks."""
+                while True:
+                    item = file_queue.get()
+                    if item is None:
+                        return
+                    rel_path, file_path, size = item
+                    dest_name = blob_name_prefix + rel_path
+                    try:
+                        if existing and self._is_unchanged(existing, dest_name, file_path, size):
+                            _record(rel_path, skipped=True)
+                            continue
+                    except Exception as e:
+                        _record(rel_path, str(e))
+                        continue
+                    yield rel_path, file_path, dest_name
+            
+            def _process_dispatcher(file_queue: queue.Queue):
+                # The pool pulls tasks as the walk produces them; the bounded
+                # queue (and the pool's task pipe) keep memory flat
+                tasks = _process_tasks(file_queue)
                 try:
-                    blob = bucket.blob(dest_name)
-                    blob.upload_from_filename(file_path)
-                    logging.info(f"Uploaded {rel_path} -> {dest_name}")
-                    uploaded_count += 1
+                    for rel_path, error in self._upload_in_processes(bucket_name, tasks):
+                        _record(rel_path, error)
                 except Exception as e:
-                    logging.warning(f"Failed to upload {rel_path}: {str(e)}")
-                    continue
+                    # Keep draining so the walk doesn't block on a full queue
+                    logging.error(f"Process pool failed: {e}")
+                    for rel_path, _, _ in tasks:
+                        _record(rel_path, str(e))
+            
+            # Worker threads upload while this thread is still walking the tree.
+            # With use_processes, a single thread feeds small files to the process pool.
+            if self.use_processes:
+                small_pool = (small_queue, _process_dispatcher, 1)
+            else:
+                small_pool = (small_queue, _upload_worker, self.max_workers)
+            pools = (small_pool, (large_queue, _upload_worker, _LARGE_UPLOAD_WORKERS))
+            with ThreadPoolExecutor(max_workers=small_pool[2] + _LARGE_UPLOAD_WORKERS) as executor:
+                for file_queue, worker, worker_count in pools:
+                    for _ in range(worker_count):
+                        executor.submit(worker, file_queue)
+                try:
+                    for entry in _iter_files(root):
+                        try:
+                            size = entry.stat().st_size
+                        except FileNotFoundError:
+                            # Deleted between the directory scan and the stat
+                            logging.warning(f"Skipping vanished file {entry.path}")
+                            continue
+                        found_count += 1
+                        rel_path = entry.path[base_len:]
+                        if convert_sep:
+                            rel_path = rel_path.replace(os.sep, "/")
+                        if size >= _SMALL_FILE_LIMIT:
+                            large_queue.put((rel_path, entry.path, size))
+                        else:
+                            small_queue.put((rel_path, entry.path, size))
+                finally:
+                    for file_queue, _, worker_count in pools:
+                        for _ in range(worker_count):
+                            file_queue.put(None)
+            
+            logging.info(f"Found {found_count} file(s) (including in subdirectories) in {directory_path}")
+            if not found_count:
+                return False, "No files found in directory", 0
+            logging.info(f"Uploaded {uploaded_count}/{found_count} file(s) to gs://{bucket_name}/{blob_name_prefix} "
+                         f"({skipped_count} unchanged, skipped)")
             
-            if uploaded_count == len(all_files):
+            if uploaded_count == found_count:
                 return True, None, uploaded_count
             else:
-                return False, f"Only {uploaded_count}/{len(all_files)} files uploaded successfully", uploaded_count
+                return False, f"Only {uploaded_count}/{found_count} files uploaded successfully", uploaded_count
         
         except Exception as e:
             error_msg = f"Error uploading directory: {str(e)}"
@@ -801,22 +1336,39 @@ class CombinedConverterUploaderGUI:
         
         # Initialize variables
         self.selected_files = []  # List of files to convert and upload
+        self._selected_set: set = set()  # Same paths, for duplicate checks
         self.save_location = None
         self.converter = None
         self.uploader = None
         self.conversion_thread = None
         # Latest progress percentage (updated by background worker)
         self._latest_pct: Optional[float] = None
-        # ID returned by `after` for the periodic refresher
-        self._progress_refresher_id: Optional[str] = None
+        # Set when _latest_pct moved since the refresher last showed it
+        self._progress_dirty = False
+        # Progress bar redraws and status dumps are done by _periodic_pump while active
+        self._progress_refresh_active = False
+        self._last_progress_draw = 0.0
+        self._status_display_active = False
+        self._last_status_dump = 0.0
         # Track progress and status per file for parallel processing
         self._file_progress: dict = {}  # {file_name: percentage}
+        self._progress_sum = 0.0  # Running total of _file_progress values
+        self._file_order: list = []  # _file_progress keys in display order
         self._file_status: dict = {}  # {file_name: status_message}
-        self._status_display_timer_id: Optional[str] = None
+        # Last block written by _display_all_file_statuses, to skip repeats
+        self._last_status_block: Optional[str] = None
+        # Status lines waiting to be written by _flush_status_text
+        self._pending_status: deque = deque()
+        # Tk calls posted by worker threads, run on the main thread by _drain_ui_queue
+        self._ui_queue: "queue.Queue[tuple]" = queue.Queue()
         self._processing_lock = threading.Lock()
         # Limit concurrent aria_mps processes to avoid resource conflicts
+        # (read once per batch as the number of file worker threads)
         self._max_concurrent_conversions = 2  # Default value
-        self._conversion_semaphore = threading.Semaphore(self._max_concurrent_conversions)
+        # Files uploaded in parallel per MPS output folder
+        self._max_concurrent_uploads = _DEFAULT_UPLOAD_WORKERS
+        # Object uploads started per second (0 = unlimited)
+        self._upload_qps = _DEFAULT_UPLOAD_QPS
 
         # Global authentication lock - only one aria_mps can authenticate at a time
         # (fixes race condition when multiple instances auth with same credentials)
@@ -836,6 +1388,9 @@ class CombinedConverterUploaderGUI:
         
         # Build the UI on the inner frame
         self.build_ui()
+        # One recurring `after` drives every periodic GUI update
+        self._pump_id: Optional[str] = None
+        self._periodic_pump()
         
         logging.info("GUI Application initialized")
     
@@ -880,14 +1435,7 @@ class CombinedConverterUploaderGUI:
         log_file = Path.home() / '.aria_uploader' / 'aria_uploader_v2.log'
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(str(log_file)),
-                logging.StreamHandler()
-            ]
-        )
+        _configure_logging(str(log_file))
     
     def build_ui(self):
         """Build the user interface."""
@@ -1128,6 +1676,42 @@ class CombinedConverterUploaderGUI:
             width=8
         ).pack(side="left", padx=5)
         
+        # Max concurrent uploads input
+        upload_input_frame = tk.Frame(concurrency_frame)
+        upload_input_frame.pack(fill="x", pady=5)
+        
+        tk.Label(upload_input_frame, text="Max Concurrent Uploads:").pack(side="left", padx=(0, 5))
+        self.max_uploads_entry = tk.Entry(upload_input_frame, width=10)
+        self.max_uploads_entry.insert(0, str(self._max_concurrent_uploads))
+        self.max_uploads_entry.pack(side="left", padx=5)
+        
+        tk.Button(
+            upload_input_frame,
+            text="Apply",
+            command=self.update_max_concurrent_uploads,
+            bg="#3498db",
+            fg="white",
+            width=8
+        ).pack(side="left", padx=5)
+        
+        # Upload rate limit input
+        qps_input_frame = tk.Frame(concurrency_frame)
+        qps_input_frame.pack(fill="x", pady=5)
+        
+        tk.Label(qps_input_frame, text="Upload QPS (0 = unlimited):").pack(side="left", padx=(0, 5))
+        self.upload_qps_entry = tk.Entry(qps_input_frame, width=10)
+        self.upload_qps_entry.insert(0, str(self._upload_qps))
+        self.upload_qps_entry.pack(side="left", padx=5)
+        
+        tk.Button(
+            qps_input_frame,
+            text="Apply",
+            command=self.update_upload_qps,
+            bg="#3498db",
+            fg="white",
+            width=8
+        ).pack(side="left", padx=5)
+        
         # Informational label
         info_label = tk.Label(
             concurrency_frame,
@@ -1142,7 +1726,7 @@ class CombinedConverterUploaderGUI:
         # Current status label
         self.concurrency_status_label = tk.Label(
             concurrency_frame,
-            text=f"Currently: {self._max_concurrent_conversions} conversions",
+            text=self._concurrency_status_text(),
             fg="blue",
             font=("Arial", 9)
         )
@@ -1159,17 +1743,58 @@ class CombinedConverterUploaderGUI:
                 messagebox.showwarning("Warning", "Setting high values (>16) may overwhelm your system.\nProceed with caution.")
             
             self._max_concurrent_conversions = new_value
-            # Recreate the semaphore with the new value
-            self._conversion_semaphore = threading.Semaphore(new_value)
             
             # Update status label
-            self.concurrency_status_label.config(text=f"Currently: {new_value} conversions")
+            self.concurrency_status_label.config(text=self._concurrency_status_text())
             
             messagebox.showinfo("Success", f"Max concurrent conversions set to {new_value}.\nThis will take effect for the next batch of conversions.")
             logging.info(f"Max concurrent conversions updated to {new_value}")
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid integer.")
     
+    def update_max_concurrent_uploads(self):
+        """Update the number of files uploaded in parallel."""
+        try:
+            new_value = int(self.max_uploads_entry.get())
+            if new_value < 1:
+                messagebox.showerror("Invalid Input", "Max concurrent uploads must be at least 1.")
+                return
+            if new_value > 64:
+                messagebox.showwarning("Warning", "Setting high values (>64) may saturate your network connection.\nProceed with caution.")
+            
+            self._max_concurrent_uploads = new_value
+            self.concurrency_status_label.config(text=self._concurrency_status_text())
+            
+            messagebox.showinfo("Success", f"Max concurrent uploads set to {new_value}.\nThis will take effect for the next batch of uploads.")
+            logging.info(f"Max concurrent uploads updated to {new_value}")
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a valid integer.")
+    
+    def update_upload_qps(self):
+        """Update the number of uploads started per second."""
+        try:
+            new_value = int(self.upload_qps_entry.get())
+            if new_value < 0:
+                messagebox.showerror("Invalid Input", "Upload QPS must be 0 (unlimited) or more.")
+                return
+            if new_value == 0:
+                messagebox.showwarning("Warning", "Uploads will not be rate limited; large folders may be throttled by Google Cloud (HTTP 429).\nProceed with caution.")
+            elif new_value > 1000:
+                messagebox.showwarning("Warning", "Above 1000 uploads per second Google Cloud may throttle uploads (HTTP 429).\nProceed with caution.")
+            
+            self._upload_qps = new_value
+            self.concurrency_status_label.config(text=self._concurrency_status_text())
+            
+            messagebox.showinfo("Success", f"Upload QPS set to {new_value}.\nThis will take effect for the next batch of uploads.")
+            logging.info(f"Upload QPS updated to {new_value}")
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a valid integer.")
+    
+    def _concurrency_status_text(self) -> str:
+        qps = self._upload_qps or "unlimited"
+        return (f"Currently: {self._max_concurrent_conversions} conversions, "
+                f"{self._max_concurrent_uploads} uploads, {qps} uploads/s")
+    
     def build_gcloud_section(self):
         """Build the Google Cloud section."""
         gcloud_frame = tk.LabelFrame(
@@ -1263,20 +1888,23 @@ class CombinedConverterUploaderGUI:
         progress_frame.pack(padx=15, pady=10, fill="both", expand=False)
         
         # Progress bar
-        self.progress_canvas = tk.Canvas(
+        ttk.Style(self.root).configure("Green.Horizontal.TProgressbar", background="#27ae60")
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(
             progress_frame,
-            width=500,
-            height=30,
-            bg="white",
-            highlightthickness=1,
-            highlightbackground="#bdc3c7"
+            orient="horizontal",
+            length=500,
+            mode="determinate",
+            maximum=100,
+            variable=self.progress_var,
+            style="Green.Horizontal.TProgressbar"
         )
-        self.progress_canvas.pack(pady=10)
+        self.progress_bar.pack(pady=10)
         
         # Progress label
         self.progress_label = tk.Label(
             progress_frame,
-            text="0%",
+            text="0.00%",
             font=("Arial", 10, "bold")
         )
         self.progress_label.pack()
@@ -1397,18 +2025,26 @@ class CombinedConverterUploaderGUI:
             filetypes=[("VRS Files", "*.vrs"), ("All Files", "*.*")]
         )
         if file_paths:
+            new_files = []
             for file_path in file_paths:
-                if file_path not in self.selected_files:
-                    self.selected_files.append(file_path)
+                if file_path not in self._selected_set:
+                    self._selected_set.add(file_path)
+                    new_files.append(file_path)
                     logging.info(f"VRS file added: {file_path}")
-            self.update_files_display()
+            if new_files:
+                self.selected_files.extend(new_files)
+                # Append only the new rows, in a single listbox call
+                self.files_listbox.insert(tk.END, *map(self._file_display_name, new_files))
+    
+    @staticmethod
+    def _file_display_name(file_path: str) -> str:
+        return f"{Path(file_path).name} ({file_path})"
     
     def update_files_display(self):
         """Update the files listbox display."""
         self.files_listbox.delete(0, tk.END)
-        for file_path in self.selected_files:
-            file_name = Path(file_path).name
-            self.files_listbox.insert(tk.END, f"{file_name} ({file_path})")
+        if self.selected_files:
+            self.files_listbox.insert(tk.END, *map(self._file_display_name, self.selected_files))
     
     def remove_selected_file(self):
         """Remove the selected file from the list."""
@@ -1416,14 +2052,16 @@ class CombinedConverterUploaderGUI:
         if selection:
             index = selection[0]
             removed_file = self.selected_files.pop(index)
+            self._selected_set.discard(removed_file)
+            self.files_listbox.delete(index)
             logging.info(f"VRS file removed: {removed_file}")
-            self.update_files_display()
     
     def clear_all_files(self):
         """Clear all selected files."""
         if self.selected_files:
             if messagebox.askyesno("Confirm", "Clear all selected files?"):
                 self.selected_files.clear()
+                self._selected_set.clear()
                 self.update_files_display()
                 logging.info("All VRS files cleared")
     
@@ -1483,59 +2121,107 @@ class CombinedConverterUploaderGUI:
                 pct = float(percentage)
             except Exception:
                 pct = 0.0
-            pct = max(0.0, min(100.0, pct))
-            self._latest_pct = pct
+            self._set_latest_pct(max(0.0, min(100.0, pct)))
         
-        # Update status text only if there's a message
+        # Queue the message; _flush_status_text writes queued lines in one insert
         if message:
-            self.status_text.insert(tk.END, message + "\n")
+            self._pending_status.append(message + "\n")
+    
+    def _periodic_pump(self):
+        """Run all periodic GUI work from one `after` loop, timed with time.monotonic."""
+        try:
+            self._drain_ui_queue()
+            now = time.monotonic()
+            if self._progress_refresh_active and now - self._last_progress_draw >= _PROGRESS_DRAW_INTERVAL:
+                self._last_progress_draw = now
+                self._refresh_progress()
+            if self._status_display_active and now - self._last_status_dump >= _STATUS_DUMP_INTERVAL:
+                self._last_status_dump = now
+                self._display_all_file_statuses()
+            self._flush_status_text()
+        finally:
+            # Always re-arm: an exception in one tick (e.g. from a posted call)
+            # must not stop every later GUI update
+            busy = (
+                self._progress_refresh_active
+                or self._status_display_active
+                or (self.conversion_thread is not None and self.conversion_thread.is_alive())
+                or not self._ui_queue.empty()
+                or bool(self._pending_status)
+            )
+            interval = _PUMP_INTERVAL_MS if busy else _PUMP_IDLE_INTERVAL_MS
+            self._pump_id = self.root.after(interval, self._periodic_pump)
+
+    def _flush_status_text(self):
+        """Write queued status lines to the status text in one insert."""
+        if self._pending_status:
+            lines = []
+            while self._pending_status:
+                lines.append(self._pending_status.popleft())
+            self.status_text.insert(tk.END, "".join(lines))
+            # Drop the oldest lines so inserts don't slow down as the log grows
+            self.status_text.delete("1.0", f"end-{_STATUS_MAX_LINES}l")
             self.status_text.see(tk.END)
-            self.root.update_idletasks()
 
-    def _draw_progress(self, pct: float):
-        """Draw the progress bar and label for the given percentage."""
+    def _on_ui(self, func, *args, **kwargs):
+        """Run a Tk call on the main thread; safe to call from worker threads."""
+        self._ui_queue.put((func, args, kwargs))
+    
+    def _drain_ui_queue(self):
+        """Run Tk calls posted by worker threads."""
+        while True:
+            try:
+                func, args, kwargs = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            func(*args, **kwargs)
+    
+    def _set_latest_pct(self, pct: float):
+        """Record the overall percentage; changes under 0.01% don't trigger a redraw."""
+        if self._latest_pct is None or abs(pct - self._latest_pct) > 0.01:
+            self._latest_pct = pct
+            self._progress_dirty = True
+    
+    def _show_progress(self, pct: float):
+        """Set the progress bar and label to the given percentage."""
         try:
             pct = float(pct)
         except Exception:
             pct = 0.0
         pct = max(0.0, min(100.0, pct))
         
-        # Draw the bar
-        self.progress_canvas.delete("progress")
-        width = 500 * (pct / 100.0)
-        self.progress_canvas.create_rectangle(
-            0, 0, width, 30,
-            fill="#27ae60",
-            tags="progress"
-        )
-        
+        self.progress_var.set(pct)
         # Update the percentage label (always show 2 decimal places)
         self.progress_label.config(text=f"{pct:.2f}%")
 
-    def _progress_refresher(self):
-        """Periodic refresher called via `after` to update the progress bar every second."""
-        if self._latest_pct is not None:
-            self._draw_progress(self._latest_pct)
-        # schedule next run in 1000ms
-        self._progress_refresher_id = self.root.after(1000, self._progress_refresher)
+    def _refresh_progress(self):
+        """Update the progress bar (called by _periodic_pump every second)."""
+        # Workers only write _latest_pct; the main-thread pump is what touches Tk,
+        # and only when the value actually moved
+        if self._progress_dirty:
+            self._progress_dirty = False
+            self._show_progress(self._latest_pct)
+        # Stop refreshing only once the batch thread has exited: files can sit
+        # at 100% while uploads, moves or the batch summary are still pending.
+        # The value drawn above is the last one, and the next batch restarts
+        # the refresher.
+        batch_running = self.conversion_thread is not None and self.conversion_thread.is_alive()
+        if not batch_running:
+            self._progress_refresh_active = False
 
     def _start_progress_refresher(self):
-        if self._progress_refresher_id is None:
-            self._progress_refresher_id = self.root.after(1000, self._progress_refresher)
+        if not self._progress_refresh_active:
+            self._last_progress_draw = time.monotonic()
+            self._progress_refresh_active = True
 
     def _stop_progress_refresher(self):
-        if self._progress_refresher_id is not None:
-            try:
-                self.root.after_cancel(self._progress_refresher_id)
-            except Exception:
-                pass
-            self._progress_refresher_id = None
+        self._progress_refresh_active = False
     
     def clear_status(self):
         """Clear the status text area."""
+        self._pending_status.clear()
         self.status_text.delete("1.0", tk.END)
-        self.progress_canvas.delete("progress")
-        self.progress_label.config(text="0%")
+        self._show_progress(0.0)
         self.status_label.config(text="Ready", fg="blue")
     
     def clear_credentials(self):
@@ -1615,9 +2301,11 @@ class CombinedConverterUploaderGUI:
             self.status_label.config(text="Converting and uploading...", fg="orange")
         
         # Clear previous status
+        self._pending_status.clear()
         self.status_text.delete("1.0", tk.END)
         # Initialize latest percentage and start refresher (updates bar every second)
         self._latest_pct = 0.0
+        self._progress_dirty = True
         self._start_progress_refresher()
         
         # Create converter only if needed
@@ -1648,71 +2336,113 @@ class CombinedConverterUploaderGUI:
         try:
             total_files = len(vrs_files)
             
-            # Initialize progress tracking for all files
+            # Per-file display names, computed once and passed down the pipeline
+            file_names = [Path(vrs_file).stem for vrs_file in vrs_files]
+            
+            # Initialize progress tracking for this batch's files; the dicts are
+            # built outside the lock and swapped in, which also drops entries
+            # left over from a previous batch (they'd skew the average and counts)
+            new_progress = dict.fromkeys(file_names, 0.0)
+            new_status = dict.fromkeys(file_names, "Queued")
+            # Names don't change during the batch, so sort once for the status display
+            file_order = sorted(new_progress)
             with self._processing_lock:
-                for vrs_file in vrs_files:
-                    file_name = Path(vrs_file).stem
-                    self._file_progress[file_name] = 0.0
-                    self._file_status[file_name] = "Queued"
+                self._file_progress = new_progress
+                self._file_status = new_status
+                self._file_order = file_order
+                self._progress_sum = 0.0
             
             # Initialize Google Cloud uploader once for all files (only if uploading)
             if process_mode in ("convert_upload", "upload_only"):
-                self.uploader = GoogleCloudUploader(gcloud_cred)
+                self.uploader = GoogleCloudUploader(gcloud_cred, max_workers=self._max_concurrent_uploads,
+                                                    max_qps=self._upload_qps)
                 self.update_progress("Initializing Google Cloud client...", -1)
                 client_ok, client_error = self.uploader.initialize_client()
                 if not client_ok:
-                    self.status_label.config(text="[X] Google Cloud error", fg="red")
-                    messagebox.showerror("Google Cloud Error", client_error)
-                    self.start_button.config(state=tk.NORMAL)
+                    self._on_ui(self.status_label.config, text="[X] Google Cloud error", fg="red")
+                    self._on_ui(messagebox.showerror, "Google Cloud Error", client_error)
+                    self._on_ui(self.start_button.config, state=tk.NORMAL)
                     return
 
                 self.update_progress("Verifying bucket access...", -1)
                 bucket_ok, bucket_error = self.uploader.verify_bucket(bucket_name)
                 if not bucket_ok:
-                    self.status_label.config(text="[X] Bucket error", fg="red")
-                    messagebox.showerror("Bucket Error", bucket_error)
-                    self.start_button.config(state=tk.NORMAL)
+                    self._on_ui(self.status_label.config, text="[X] Bucket error", fg="red")
+                    self._on_ui(messagebox.showerror, "Bucket Error", bucket_error)
+                    self._on_ui(self.start_button.config, state=tk.NORMAL)
                     return
             
             # Start status display timer (shows all file statuses every 5 seconds)
-            self._start_status_display_timer()
+            self._on_ui(self._start_status_display_timer)
             
-            # Create threads for parallel processing
-            file_threads = []
-            logging.info(f"Creating {total_files} worker threads for parallel processing (max 2 concurrent conversions)...")
+            # Two stages, each a fixed pool of worker threads fed by a queue: a
+            # conversion pool (its size is the conversion cap) hands finished
+            # files to an upload pool, so an upload never holds a conversion
+            # slot. Daemon threads (rather than a ThreadPoolExecutor) so closing
+            # the window doesn't wait for conversions still in progress.
+            conversion_workers = min(total_files, self._max_concurrent_conversions)
+            if process_mode in ("convert_upload", "upload_only"):
+                upload_workers = min(total_files, _PIPELINE_UPLOAD_WORKERS)
+            else:
+                upload_workers = 0
+            file_queue: "queue.Queue[Tuple[int, str, str]]" = queue.Queue()
+            for idx, (vrs_file, file_name) in enumerate(zip(vrs_files, file_names), 1):
+                file_queue.put((idx, vrs_file, file_name))
+            upload_queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
             
-            for idx, vrs_file in enumerate(vrs_files, 1):
-                thread = threading.Thread(
-                    target=self._process_single_file,
-                    args=(vrs_file, output_dir, bucket_name, folder_prefix, idx, total_files, process_mode)
-                )
-                thread.daemon = True
-                file_threads.append(thread)
+            def _conversion_worker():
+                while True:
+                    try:
+                        idx, vrs_file, file_name = file_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    upload_path = self._process_single_file(vrs_file, file_name, output_dir, idx, total_files, process_mode)
+                    if upload_path:
+                        upload_queue.put((file_name, upload_path))
+            
+            def _upload_worker():
+                for file_name, upload_path in iter(upload_queue.get, None):
+                    self._upload_single_file(file_name, upload_path, bucket_name, folder_prefix, process_mode)
+            
+            logging.info(f"Processing {total_files} file(s) with {conversion_workers} conversion "
+                         f"and {upload_workers} upload worker thread(s)...")
+            conversion_threads = [threading.Thread(target=_conversion_worker, daemon=True) for _ in range(conversion_workers)]
+            upload_threads = [threading.Thread(target=_upload_worker, daemon=True) for _ in range(upload_workers)]
+            for thread in conversion_threads + upload_threads:
                 thread.start()
-                logging.info(f"Started thread {idx}/{total_files} for {Path(vrs_file).name}")
             
-            # Wait for all threads to complete
-            logging.info(f"Waiting for all {total_files} threads to complete...")
-            for idx, thread in enumerate(file_threads, 1):
-                logging.info(f"Joining thread {idx}/{total_files}...")
+            # Wait for all threads to complete: conversions first, then let the
+            # upload workers drain what's left
+            for thread in conversion_threads:
                 thread.join()
-                logging.info(f"Thread {idx}/{total_files} joined successfully")
+            for _ in upload_threads:
+                upload_queue.put(None)
+            for thread in upload_threads:
+                thread.join()
+            logging.info(f"All {total_files} file(s) processed")
             
             # Stop status display timer
-            self._stop_status_display_timer()
+            self._on_ui(self._stop_status_display_timer)
             
-            # Calculate final results
-            total_uploaded = sum(1 for status in self._file_status.values() if "Uploaded" in status)
-            total_converted = sum(1 for status in self._file_status.values() if "Uploaded" in status or "Skipped" in status)
+            # Calculate final results (from a snapshot, counted outside the lock)
+            with self._processing_lock:
+                final_statuses = list(self._file_status.values())
+            total_uploaded = total_converted = 0
+            for status in final_statuses:
+                uploaded = "Uploaded" in status
+                total_uploaded += uploaded
+                total_converted += uploaded or "Skipped" in status
             
             if total_uploaded > 0:
                 self.update_progress("", -1)
                 self.update_progress(f"All processing complete! {total_converted} file(s) processed, {total_uploaded} uploaded.", 100)
-                self.status_label.config(
+                self._on_ui(
+                    self.status_label.config,
                     text=f"[OK] Complete! {total_converted} file(s) processed, {total_uploaded} uploaded",
                     fg="green"
                 )
-                messagebox.showinfo(
+                self._on_ui(
+                    messagebox.showinfo,
                     "Success",
                     f"Processing completed!\n\n"
                     f"Files processed: {total_converted}/{total_files}\n"
@@ -1720,169 +2450,166 @@ class CombinedConverterUploaderGUI:
                     f"Uploaded to: gs://{bucket_name}/{folder_prefix if folder_prefix else '(root)'}"
                 )
             else:
-                self.status_label.config(text="[X] All processing failed", fg="red")
-                messagebox.showerror("Failed", "No files were processed successfully")
+                self._on_ui(self.status_label.config, text="[X] All processing failed", fg="red")
+                self._on_ui(messagebox.showerror, "Failed", "No files were processed successfully")
         
         except Exception as e:
             logging.error(f"Conversion/upload worker error: {str(e)}")
-            self.status_label.config(text=f"[X] Error: {str(e)}", fg="red")
-            messagebox.showerror("Error", f"Error: {str(e)}")
+            self._on_ui(self.status_label.config, text=f"[X] Error: {str(e)}", fg="red")
+            self._on_ui(messagebox.showerror, "Error", f"Error: {str(e)}")
         
         finally:
             # Stop timers and re-enable start button
-            try:
-                self._stop_progress_refresher()
-                self._stop_status_display_timer()
-            except Exception:
-                pass
-            self.start_button.config(state=tk.NORMAL)
+            self._on_ui(self._stop_progress_refresher)
+            self._on_ui(self._stop_status_display_timer)
+            self._on_ui(self.start_button.config, state=tk.NORMAL)
     
-    def _process_single_file(self, vrs_file: str, output_dir: str, bucket_name: str, 
-                           folder_prefix: str, file_idx: int, total_files: int,
-                           process_mode: str):
-        """Process a single VRS file: conversion → upload."""
-        file_name = Path(vrs_file).stem
-        vrs_basename = Path(vrs_file).name
+    def _process_single_file(self, vrs_file: str, file_name: str, output_dir: str, file_idx: int,
+                             total_files: int, process_mode: str) -> Optional[str]:
+        """
+        Conversion stage for a single VRS file.
         
+        Returns the path to hand to the upload stage (the MPS folder, or the
+        VRS file itself in upload-only mode), or None if there is nothing to
+        upload (convert-only mode or failure).
+        """
         logging.info(f"[{file_name}] Thread started for file {file_idx}/{total_files}")
         
         try:
-            # Update status
-            with self._processing_lock:
-                self._file_status[file_name] = "Starting..."
-            
             # Upload VRS only (no conversion)
             if process_mode == "upload_only":
-                with self._processing_lock:
-                    self._file_status[file_name] = "Uploading VRS..."
-
-                upload_ok, upload_error = self.uploader.upload_file(
-                    bucket_name,
-                    vrs_file,
-                    folder_prefix=folder_prefix,
-                    progress_callback=lambda msg, pct: None
-                )
+                self._set_status(file_name, "Waiting to upload...")
+                return vrs_file
 
-                if upload_ok:
-                    with self._processing_lock:
-                        self._file_status[file_name] = "Uploaded VRS"
-                        self._file_progress[file_name] = 100.0
-                    logging.info(f"Successfully uploaded VRS {file_name}")
-                else:
-                    with self._processing_lock:
-                        self._file_status[file_name] = f"Upload failed: {upload_error}"
-                        self._file_progress[file_name] = 0.0
-                    logging.error(f"Upload failed for {file_name}: {upload_error}")
-                return
+            # Update status
+            self._set_status(file_name, "Starting...")
 
             # Determine output directory:
             # If output_dir is None or empty, use VRS file's parent directory
             # Otherwise, create subdirectory in user-specified location
+            mps_folder_name = f"mps_{file_name}_vrs"
             if output_dir:
-                mps_folder_name = f"mps_{file_name}_vrs"
                 file_output_dir = os.path.join(output_dir, mps_folder_name)
                 logging.info(f"[{file_name}] Using user-specified output dir: {file_output_dir}")
             else:
                 # Use the same directory as the VRS file
-                vrs_parent = str(Path(vrs_file).parent)
-                mps_folder_name = f"mps_{file_name}_vrs"
-                file_output_dir = os.path.join(vrs_parent, mps_folder_name)
+                file_output_dir = os.path.join(os.path.dirname(vrs_file), mps_folder_name)
                 logging.info(f"[{file_name}] Using VRS file directory: {file_output_dir}")
             
-            # Check if MPS files already exist
-            if os.path.exists(file_output_dir):
+            # Check if MPS files already exist (stops at the first file found)
+            try:
+                output_exists = True
+                has_files = _has_files(file_output_dir)
+            except FileNotFoundError:
+                output_exists = has_files = False
+            except OSError as e:
+                # Not a directory or unreadable: treat as empty and convert,
+                # as the os.walk check did
+                logging.warning(f"[{file_name}] Could not scan {file_output_dir}: {str(e)}")
                 has_files = False
-                for root, dirs, files in os.walk(file_output_dir):
-                    if files:
-                        has_files = True
-                        break
-                
-                if has_files:
-                    with self._processing_lock:
-                        self._file_status[file_name] = "Skipped (exists)"
-                        self._file_progress[file_name] = 100.0
-                    logging.info(f"[{file_name}] Skipping conversion - MPS files already exist at {file_output_dir}")
-                    converted_dir = file_output_dir
-                else:
-                    logging.info(f"[{file_name}] Output dir exists but empty, converting...")
-                    # Convert
-                    converted_dir = self._convert_file(vrs_file, file_output_dir, file_name, vrs_basename)
+            
+            if has_files:
+                self._set_status(file_name, "Skipped (exists)", 100.0)
+                logging.info(f"[{file_name}] Skipping conversion - MPS files already exist at {file_output_dir}")
+                converted_dir = file_output_dir
             else:
-                logging.info(f"[{file_name}] Output dir does not exist, converting...")
+                if output_exists:
+                    logging.info(f"[{file_name}] Output dir exists but empty, converting...")
+                else:
+                    logging.info(f"[{file_name}] Output dir does not exist, converting...")
                 # Convert
-                converted_dir = self._convert_file(vrs_file, file_output_dir, file_name, vrs_basename)
+                converted_dir = self._convert_file(vrs_file, file_output_dir, file_name)
             
             if not converted_dir:
-                with self._processing_lock:
-                    self._file_status[file_name] = "Conversion failed"
-                    self._file_progress[file_name] = 0.0
-                return
+                self._set_status(file_name, "Conversion failed", 0.0)
+                return None
             
             # Conversion only (no upload)
             if process_mode == "convert_only":
-                with self._processing_lock:
-                    self._file_status[file_name] = "Conversion complete"
-                    self._file_progress[file_name] = 100.0
+                self._set_status(file_name, "Conversion complete", 100.0)
                 logging.info(f"Conversion complete (no upload) for {file_name}")
+                return None
+            
+            return converted_dir
+        
+        except Exception as e:
+            self._set_status(file_name, f"Error: {str(e)}", 0.0)
+            logging.error(f"Error processing {file_name}: {str(e)}")
+            return None
+        
+        finally:
+            logging.info(f"[{file_name}] Thread completing for file {file_idx}/{total_files}")
+    
+    def _upload_single_file(self, file_name: str, upload_path: str, bucket_name: str,
+                            folder_prefix: str, process_mode: str):
+        """Upload stage: upload a converted MPS folder, or the VRS file in upload-only mode."""
+        try:
+            # Upload VRS only (no conversion)
+            if process_mode == "upload_only":
+                self._set_status(file_name, "Uploading VRS...")
+
+                upload_ok, upload_error = self.uploader.upload_file(
+                    bucket_name,
+                    upload_path,
+                    folder_prefix=folder_prefix
+                )
+
+                if upload_ok:
+                    self._set_status(file_name, "Uploaded VRS", 100.0)
+                    logging.info(f"Successfully uploaded VRS {file_name}")
+                else:
+                    self._set_status(file_name, f"Upload failed: {upload_error}", 0.0)
+                    logging.error(f"Upload failed for {file_name}: {upload_error}")
                 return
 
-            # Upload immediately after conversion
-            with self._processing_lock:
-                self._file_status[file_name] = "Uploading..."
+            self._set_status(file_name, "Uploading...")
 
             upload_ok, upload_error, files_uploaded = self.uploader.upload_directory(
                 bucket_name,
-                converted_dir,
+                upload_path,
                 folder_prefix=folder_prefix,
-                progress_callback=lambda msg, pct: None  # Suppress individual upload progress
+                progress_callback=self._upload_progress_callback(file_name)
             )
 
             if upload_ok or files_uploaded > 0:
-                with self._processing_lock:
-                    self._file_status[file_name] = f"Uploaded ({files_uploaded} files)"
-                    self._file_progress[file_name] = 100.0
+                self._set_status(file_name, f"Uploaded ({files_uploaded} files)", 100.0)
                 logging.info(f"Successfully uploaded {file_name}: {files_uploaded} files")
             else:
-                with self._processing_lock:
-                    self._file_status[file_name] = f"Upload failed: {upload_error}"
-                    self._file_progress[file_name] = 100.0
+                self._set_status(file_name, f"Upload failed: {upload_error}", 100.0)
                 logging.error(f"Upload failed for {file_name}: {upload_error}")
         
         except Exception as e:
-            with self._processing_lock:
-                self._file_status[file_name] = f"Error: {str(e)}"
-                self._file_progress[file_name] = 0.0
-            logging.error(f"Error processing {file_name}: {str(e)}")
-        
-        finally:
-            logging.info(f"[{file_name}] Thread completing for file {file_idx}/{total_files}")
+            self._set_status(file_name, f"Error: {str(e)}", 0.0)
+            logging.error(f"Error uploading {file_name}: {str(e)}")
     
-    def _convert_file(self, vrs_file: str, file_output_dir: str, file_name: str, vrs_basename: str) -> Optional[str]:
+    def _convert_file(self, vrs_file: str, file_output_dir: str, file_name: str) -> Optional[str]:
         """Convert a single VRS file to MPS."""
-        with self._processing_lock:
-            self._file_status[file_name] = "Waiting to start..."
+        # Create a callback that updates this file's progress and stage.
+        # Only this file's conversion thread calls it, so the throttle state
+        # below needs no lock.
+        last_update = 0.0
+        last_message = None
         
-        logging.info(f"[{file_name}] Waiting to acquire conversion semaphore (current value: {self._conversion_semaphore._value})...")
-        
-        # Create a callback that updates this file's progress and stage
         def progress_callback(message: str, percentage: float):
-            # Update stage if message contains a stage name
-            if message:
-                with self._processing_lock:
-                    self._file_status[file_name] = message
+            nonlocal last_update, last_message
+            now = time.monotonic()
+            message_changed = bool(message) and message != last_message
+            # Drop rapid-fire percentage updates; stage changes and 100% always go through
+            if not message_changed and percentage < 100 and now - last_update < _GUI_PROGRESS_INTERVAL:
+                return
+            last_update = now
             
-            if percentage >= 0:
-                with self._processing_lock:
-                    self._file_progress[file_name] = percentage
-                # Update average progress immediately (for 1-second bar refresh)
-                self._update_average_progress()
-        
-        # Use semaphore to limit concurrent conversions (prevent resource conflicts)
-        self._conversion_semaphore.acquire()
-        logging.info(f"[{file_name}] Semaphore acquired (new value: {self._conversion_semaphore._value}), starting conversion...")
+            # One critical section per accepted callback: status, progress and
+            # the overall average (for the 1-second bar refresh) together
+            if message_changed:
+                last_message = message
+            self._set_status(file_name,
+                             message if message_changed else None,
+                             percentage if percentage >= 0 else None)
+        
+        logging.info(f"[{file_name}] Starting conversion...")
         try:
-            with self._processing_lock:
-                self._file_status[file_name] = "Starting conversion..."
+            self._set_status(file_name, "Starting conversion...")
             
             success, result_dir = self.converter.convert_vrs_to_mps(
                 vrs_file,
@@ -1892,66 +2619,81 @@ class CombinedConverterUploaderGUI:
             )
             
             if success and result_dir:
-                with self._processing_lock:
-                    self._file_status[file_name] = "Conversion complete"
-                    self._file_progress[file_name] = 100.0
+                self._set_status(file_name, "Conversion complete", 100.0)
                 logging.info(f"Successfully converted {file_name} to {result_dir}")
                 return result_dir
             else:
-                with self._processing_lock:
-                    self._file_status[file_name] = "Conversion failed (returned None)"
+                self._set_status(file_name, "Conversion failed (returned None)")
                 logging.error(f"Conversion failed for {file_name}: returned success={success}, result_dir={result_dir}")
                 logging.error(f"Check log file at ~/.aria_uploader/aria_uploader_v2.log for full conversion output")
                 return None
         except Exception as e:
-            with self._processing_lock:
-                self._file_status[file_name] = f"Conversion exception: {str(e)}"
+            self._set_status(file_name, f"Conversion exception: {str(e)}")
             logging.error(f"Exception during conversion of {file_name}: {str(e)}", exc_info=True)
             return None
-        finally:
-            # Always release the semaphore
-            logging.info(f"[{file_name}] Releasing conversion semaphore (current value: {self._conversion_semaphore._value})...")
-            self._conversion_semaphore.release()
-            logging.info(f"[{file_name}] Semaphore released (new value: {self._conversion_semaphore._value})")
     
-    def _update_average_progress(self):
-        """Calculate and update average progress across all files."""
+    def _upload_progress_callback(self, file_name: str):
+        """
+        Build an upload_directory progress callback for one file.
+        
+        Only the file's status entry is updated (no Tk calls from upload
+        threads); the periodic status display renders the latest count, so
+        thousands of small uploads cost a handful of UI updates.
+        """
+        files_done = 0
+        
+        def progress_callback(message: str, percentage: float):
+            # upload_directory serializes its callbacks, so the counter needs no lock
+            nonlocal files_done
+            files_done += 1
+            self._set_status(file_name, f"Uploading... ({files_done} files done)")
+        return progress_callback
+    
+    def _set_status(self, file_name: str, status: Optional[str] = None,
+                    percentage: Optional[float] = None):
+        """Set a file's status and/or progress in one short critical section."""
         with self._processing_lock:
-            if self._file_progress:
-                avg_pct = sum(self._file_progress.values()) / len(self._file_progress)
-                self._latest_pct = avg_pct
+            # Unchanged statuses are not rewritten
+            if status is not None and self._file_status.get(file_name) != status:
+                self._file_status[file_name] = status
+            if percentage is not None:
+                self._set_progress(file_name, percentage)
+    
+    def _set_progress(self, file_name: str, percentage: float):
+        """
+        Set a file's progress and update the overall average (hold _processing_lock).
+        
+        The running total makes the average O(1), so every progress change,
+        not just converter callbacks, moves the bar.
+        """
+        self._progress_sum += percentage - self._file_progress.get(file_name, 0.0)
+        self._file_progress[file_name] = percentage
+        self._set_latest_pct(self._progress_sum / len(self._file_progress))
     
     def _display_all_file_statuses(self):
-        """Display status of all files (called every 5 seconds)."""
+        """Display status of all files (called by _periodic_pump every 5 seconds)."""
+        # Snapshot under the lock; sorting and formatting happen without it
         with self._processing_lock:
-            status_lines = []
-            for file_name in sorted(self._file_progress.keys()):
-                pct = self._file_progress[file_name]
-                status = self._file_status[file_name]
-                status_lines.append(f"{file_name}: {pct:.2f}% - {status}")
-            
-            if status_lines:
-                status_text = "\n".join(status_lines)
-                self.update_progress(f"\n--- STATUS UPDATE ---", -1)
-                self.update_progress(status_text, -1)
+            progress = dict(self._file_progress)
+            statuses = dict(self._file_status)
         
-        # Schedule next status display
-        if self._status_display_timer_id is not None:
-            self._status_display_timer_id = self.root.after(5000, self._display_all_file_statuses)
+        status_lines = [f"{name}: {progress[name]:.2f}% - {statuses[name]}" for name in self._file_order]
+        status_text = "\n".join(status_lines)
+        # Only append when something changed since the last status update
+        if status_lines and status_text != self._last_status_block:
+            self._last_status_block = status_text
+            self.update_progress(f"\n--- STATUS UPDATE ---\n{status_text}", -1)
     
     def _start_status_display_timer(self):
-        """Start the 5-second status display timer."""
-        if self._status_display_timer_id is None:
-            self._status_display_timer_id = self.root.after(5000, self._display_all_file_statuses)
+        """Start the 5-second status display."""
+        self._last_status_block = None
+        if not self._status_display_active:
+            self._last_status_dump = time.monotonic()
+            self._status_display_active = True
     
     def _stop_status_display_timer(self):
-        """Stop the status display timer."""
-        if self._status_display_timer_id is not None:
-            try:
-                self.root.after_cancel(self._status_display_timer_id)
-            except Exception:
-                pass
-            self._status_display_timer_id = None
+        """Stop the status display."""
+        self._status_display_active = False
 
 
 def main_gui():
@@ -1974,12 +2716,23 @@ Examples:
   # Using CLI with arguments
   python aria_uploader_v2.py --input sample.vrs --output ./mps_output \\
     --gcloud-cred service-account.json --bucket my-bucket
+  
+  # Several recordings, two converted at a time
+  python aria_uploader_v2.py --input a.vrs b.vrs c.vrs --jobs 2 --output ./mps_output
         """
     )
     
     parser.add_argument(
         '--input', '-i',
-        help='Path to the input VRS file (CLI mode)'
+        nargs='+',
+        help='Path(s) to the input VRS file(s) (CLI mode)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=2,
+        help='Number of VRS files to convert concurrently (default: 2)'
     )
     
     parser.add_argument(
@@ -2012,6 +2765,27 @@ Examples:
         help='Optional folder prefix in the bucket'
     )
     
+    parser.add_argument(
+        '--upload-workers',
+        type=int,
+        default=_DEFAULT_UPLOAD_WORKERS,
+        help=f'Number of files uploaded in parallel (default: {_DEFAULT_UPLOAD_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '--upload-processes',
+        action='store_true',
+        help='Upload small files from worker processes instead of threads (faster for '
+             'folders with many files)'
+    )
+    
+    parser.add_argument(
+        '--upload-qps',
+        type=int,
+        default=_DEFAULT_UPLOAD_QPS,
+        help=f'Maximum uploads started per second, 0 for unlimited (default: {_DEFAULT_UPLOAD_QPS})'
+    )
+    
     args = parser.parse_args()
     
     # If no input file provided, launch GUI
@@ -2031,18 +2805,45 @@ Examples:
     
     output_dir = args.output or "./mps_output"
     
-    # Converter
+    # A single input converts straight into output_dir; several inputs each get
+    # their own mps_<name>_vrs folder inside it (same layout as the GUI)
+    if len(args.input) == 1:
+        jobs = [(args.input[0], output_dir)]
+    else:
+        jobs = [(vrs_file, os.path.join(output_dir, f"mps_{Path(vrs_file).stem}_vrs")) for vrs_file in args.input]
+    
+    # Converter. Each conversion runs in its own aria_mps process, so threads
+    # only wait on child output; the auth lock keeps logins one at a time.
     converter = VRStoMPSConverter(aria_username, aria_password)
-    success, result_dir = converter.convert_vrs_to_mps(args.input, output_dir)
+    auth_lock = threading.Lock()
+    converted_dirs = []
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as executor:
+        futures = {
+            executor.submit(converter.convert_vrs_to_mps, vrs_file, job_output_dir, None, auth_lock): vrs_file
+            for vrs_file, job_output_dir in jobs
+        }
+        for future in as_completed(futures):
+            success, result_dir = future.result()
+            if success:
+                converted_dirs.append(result_dir)
+            else:
+                failed.append(futures[future])
     
-    if not success:
-        print(f"[X] Conversion failed!")
+    if failed:
+        for vrs_file in failed:
+            print(f"[X] Conversion failed: {vrs_file}")
         sys.exit(1)
     
     # Google Cloud upload
     if args.gcloud_cred and args.bucket:
         print("\nStarting upload to Google Cloud Storage...")
-        uploader = GoogleCloudUploader(args.gcloud_cred)
+        uploader = GoogleCloudUploader(
+            args.gcloud_cred,
+            max_workers=max(1, args.upload_workers),
+            use_processes=args.upload_processes,
+            max_qps=max(0, args.upload_qps)
+        )
         
         client_ok, client_error = uploader.initialize_client()
         if not client_ok:
@@ -2054,21 +2855,24 @@ Examples:
             print(f"[X] {bucket_error}")
             sys.exit(1)
         
-        upload_ok, upload_error, files_uploaded = uploader.upload_directory(
-            args.bucket,
-            output_dir,
-            folder_prefix=args.folder or ""
-        )
+        total_uploaded = 0
+        for result_dir in converted_dirs:
+            upload_ok, upload_error, files_uploaded = uploader.upload_directory(
+                args.bucket,
+                result_dir,
+                folder_prefix=args.folder or ""
+            )
+            total_uploaded += files_uploaded
+            if not (upload_ok or files_uploaded > 0):
+                print(f"[X] {upload_error}")
+                sys.exit(1)
         
-        if upload_ok or files_uploaded > 0:
-            print(f"[OK] Uploaded {files_uploaded} file(s) successfully!")
-            sys.exit(0)
-        else:
-            print(f"[X] {upload_error}")
-            sys.exit(1)
+        print(f"[OK] Uploaded {total_uploaded} file(s) successfully!")
+        sys.exit(0)
     else:
         print(f"[OK] Conversion completed successfully!")
-        print(f"[OK] Output directory: {output_dir}")
+        for result_dir in converted_dirs:
+            print(f"[OK] Output directory: {result_dir}")
         print("(Skipping upload: --gcloud-cred and --bucket not provided)")
         sys.exit(0)
 
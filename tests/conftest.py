@@ -0,0 +1,19 @@
+"""Shared fixtures: load aria_uploader_v2.3.py as a module."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "aria_uploader_v2.3.py"
+
+
+@pytest.fixture(scope="session")
+def aria_uploader():
+    """The uploader script, imported under a valid module name."""
+    # The uploader imports these at module level
+    for name in ("tkinter", "google_crc32c", "google.cloud.storage", "requests"):
+        pytest.importorskip(name)
+    spec = importlib.util.spec_from_file_location("aria_uploader", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
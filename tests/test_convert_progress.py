@@ -0,0 +1,73 @@
+"""Percentage callbacks from convert_vrs_to_mps for scripted aria CLI output."""
+import os
+import threading
+import time
+
+import pytest
+
+
+class _ScriptedProcess:
+    """Stand-in for the aria CLI process: prints lines, then stays quiet before exiting."""
+
+    def __init__(self, lines, quiet):
+        read_fd, write_fd = os.pipe()
+        self.stdout = open(read_fd, "rb")
+        self.returncode = None
+
+        def feed():
+            with open(write_fd, "wb") as pipe:
+                for line in lines:
+                    pipe.write(line.encode() + b"\n")
+                    pipe.flush()
+                time.sleep(quiet)
+
+        self._feeder = threading.Thread(target=feed, daemon=True)
+        self._feeder.start()
+
+    def wait(self):
+        self._feeder.join()
+        self.returncode = 0
+        return self.returncode
+
+
+@pytest.fixture
+def run_conversion(aria_uploader, monkeypatch, tmp_path):
+    """Start a conversion of scripted output; returns (thread, callbacks)."""
+    converter_cls = aria_uploader.VRStoMPSConverter
+    monkeypatch.setattr(converter_cls, "_aria_executable", "aria-cli")
+    vrs_file = tmp_path / "rec.vrs"
+    vrs_file.write_bytes(b"vrs")
+
+    def start(lines, quiet):
+        process = _ScriptedProcess(lines, quiet)
+        monkeypatch.setattr(aria_uploader.subprocess, "Popen", lambda *args, **kwargs: process)
+        callbacks = []
+        converter = converter_cls("user", "password")
+        thread = threading.Thread(
+            target=converter.convert_vrs_to_mps,
+            args=(str(vrs_file), str(tmp_path / "out"), lambda message, pct: callbacks.append(pct)),
+        )
+        thread.start()
+        return thread, callbacks
+
+    return start
+
+
+# Printed faster than the emit interval, so most values are coalesced away
+_LINES = ["Login successful"] + [f"Hashing {pct}%" for pct in range(98)]
+
+
+def test_last_percentage_delivered_when_output_goes_quiet(run_conversion):
+    thread, callbacks = run_conversion(_LINES, quiet=2.0)
+    time.sleep(1.0)
+    # Still inside the quiet phase: the held-back 97% must already be out
+    assert 97.0 in callbacks
+    thread.join()
+
+
+def test_last_percentage_delivered_when_process_exits(run_conversion):
+    thread, callbacks = run_conversion(_LINES, quiet=0.0)
+    thread.join()
+    percentages = [pct for pct in callbacks if pct >= 0]
+    assert 97.0 in percentages
+    assert percentages[-1] == 100.0
@@ -0,0 +1,54 @@
+"""Directory walks used by uploads and the existing-output check."""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "slam" / "sub").mkdir(parents=True)
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "summary.json").write_text("{}")
+    (tmp_path / "slam" / "traj.csv").write_text("x")
+    (tmp_path / "slam" / "sub" / "points.csv.gz").write_text("x")
+    (tmp_path / "locked" / "hidden.txt").write_text("x")
+    return tmp_path
+
+
+def _names(aria_uploader, root):
+    return sorted(os.path.relpath(entry.path, root) for entry in aria_uploader._iter_files(str(root)))
+
+
+def test_iter_files_yields_nested_files(aria_uploader, tree):
+    assert _names(aria_uploader, tree) == sorted([
+        "summary.json",
+        os.path.join("slam", "traj.csv"),
+        os.path.join("slam", "sub", "points.csv.gz"),
+        os.path.join("locked", "hidden.txt"),
+    ])
+
+
+def test_iter_files_skips_unreadable_subdirectory(aria_uploader, tree, monkeypatch):
+    scandir = os.scandir
+    locked = str(tree / "locked")
+
+    def guarded_scandir(path):
+        if path == locked:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(aria_uploader.os, "scandir", guarded_scandir)
+    assert os.path.join("locked", "hidden.txt") not in _names(aria_uploader, tree)
+    assert "summary.json" in _names(aria_uploader, tree)
+
+
+def test_iter_files_raises_for_missing_root(aria_uploader, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(aria_uploader._iter_files(str(tmp_path / "missing")))
+
+
+def test_has_files(aria_uploader, tree, tmp_path):
+    assert aria_uploader._has_files(str(tree))
+    empty = tmp_path / "empty" / "nested"
+    empty.mkdir(parents=True)
+    assert not aria_uploader._has_files(str(tmp_path / "empty"))
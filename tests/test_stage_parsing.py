@@ -0,0 +1,20 @@
+"""Stage detection for aria_mps output lines."""
+import pytest
+
+
+@pytest.mark.parametrize(
+    "line, stage",
+    [
+        ("Hashing 3%", "Hashing"),
+        ("Health check passed", "Index"),
+        ("Encrypting 40%", "Encrypting"),
+        ("Uploading with chunk_size 8.00 MB | 12%", "Uploading"),
+        ("Waiting for results", None),
+        # Folder names in the echoed [vrs:<path>] prefix must not outrank the real stage
+        ("[vrs:/data/index/rec.vrs] Hashing 3%", "Hashing"),
+        ("[vrs:C:\\uploading\\rec.vrs] Encrypting 40%", "Encrypting"),
+        ("[vrs:/mnt/downloading/rec.vrs] Uploading 7%", "Uploading"),
+    ],
+)
+def test_parse_stage(aria_uploader, line, stage):
+    assert aria_uploader._parse_stage(line) == stage
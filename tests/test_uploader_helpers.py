@@ -0,0 +1,78 @@
+"""Upload helpers that need no bucket: rate limiting, blob names, unchanged-file checks."""
+import time
+
+import pytest
+
+
+def test_rate_limiter_allows_an_initial_burst(aria_uploader):
+    limiter = aria_uploader.RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(50):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.2
+
+
+def test_rate_limiter_paces_past_the_burst(aria_uploader):
+    limiter = aria_uploader.RateLimiter(50)
+    for _ in range(50):
+        limiter.acquire()
+    start = time.monotonic()
+    for _ in range(25):
+        limiter.acquire()
+    # 25 more tokens at 50/s take about half a second
+    assert time.monotonic() - start >= 0.45
+
+
+def test_rate_limiter_below_one_per_second_still_allows_one(aria_uploader):
+    limiter = aria_uploader.RateLimiter(0.5)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.parametrize(
+    "folder_prefix, expected",
+    [
+        ("", "rec.vrs"),
+        ("batch", "batch/rec.vrs"),
+        ("/batch/", "batch/rec.vrs"),
+        ("a/b/", "a/b/rec.vrs"),
+    ],
+)
+def test_blob_name(aria_uploader, folder_prefix, expected):
+    assert aria_uploader._blob_name(folder_prefix, "rec.vrs") == expected
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    path = tmp_path / "summary.json"
+    path.write_bytes(b'{"ok": true}')
+    return str(path), path.stat().st_size
+
+
+def test_is_unchanged_when_size_and_crc_match(aria_uploader, local_file):
+    path, size = local_file
+    existing = {"pre/summary.json": (size, aria_uploader._file_crc32c(path))}
+    assert aria_uploader.GoogleCloudUploader._is_unchanged(existing, "pre/summary.json", path, size)
+
+
+def test_is_unchanged_false_for_missing_blob(aria_uploader, local_file):
+    path, size = local_file
+    assert not aria_uploader.GoogleCloudUploader._is_unchanged({}, "pre/summary.json", path, size)
+
+
+def test_is_unchanged_false_when_crc_differs(aria_uploader, local_file):
+    path, size = local_file
+    existing = {"pre/summary.json": (size, "AAAAAA==")}
+    assert not aria_uploader.GoogleCloudUploader._is_unchanged(existing, "pre/summary.json", path, size)
+
+
+def test_is_unchanged_skips_checksum_when_size_differs(aria_uploader, local_file, monkeypatch):
+    path, size = local_file
+
+    def fail(_path):
+        raise AssertionError("checksum computed for a size mismatch")
+
+    monkeypatch.setattr(aria_uploader, "_file_crc32c", fail)
+    existing = {"pre/summary.json": (size + 1, "AAAAAA==")}
+    assert not aria_uploader.GoogleCloudUploader._is_unchanged(existing, "pre/summary.json", path, size)